@@ -9,9 +9,14 @@ import sys
 import os
 import yaml
 import pyaudio
-import time
 from pynput import keyboard
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 # Add the current directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -119,12 +124,9 @@ def capture_hotkey():
     try:
         # Create keyboard listener
         with keyboard.Listener(on_press=on_press) as listener:
-            # Wait for key capture (with timeout)
-            start_time = time.time()
-            while captured_key is None and (time.time() - start_time) < 30:
-                time.sleep(0.1)
-                if not listener.running:
-                    break
+            # Wait for key capture (with timeout); the listener thread exits
+            # as soon as on_press returns False
+            listener.join(timeout=30)
 
         if captured_key:
             return captured_key
@@ -141,8 +143,8 @@ def capture_hotkey():
 def load_config(config_path="config.yaml"):
     """Load existing configuration."""
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        with open(config_path, 'rb') as f:
+            return yaml.load(f.read(), Loader=SafeLoader)
     except FileNotFoundError:
         # Return default config if file doesn't exist
         return {
@@ -155,14 +157,18 @@ def load_config(config_path="config.yaml"):
             'whisper': {
                 'model_size': "large-v3",
                 'device': "auto",
-                'language': "en"
+                'language': "en",
+                'backend': "openai-whisper",
+                'compute_type': "auto",
+                'compile': False
             },
             'hotkeys': {
                 'record_key': "right_ctrl",
                 'cancel_keys': "ctrl+shift+c"
             },
             'recording': {
-                'max_duration': 30
+                'max_duration': 30,
+                'silence_threshold': 0.001
             },
             'text': {
                 'auto_capitalize': True,
@@ -183,7 +189,7 @@ def save_config(config, config_path="config.yaml"):
     """Save configuration to file."""
     try:
         with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, indent=2)
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, indent=2)
         print(f"✅ Configuration saved to {config_path}")
         return True
     except Exception as e:
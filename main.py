@@ -35,7 +35,8 @@ def main():
         try:
             recorder.initialize_components()
             print("🎤 Single recording mode")
-            recorder.record_once()
+            if recorder.record_once():
+                recorder.wait_for_transcriptions()
         except KeyboardInterrupt:
             print("\nCancelled")
         finally:
@@ -5,9 +5,7 @@ A voice recording and transcription tool that uses OpenAI Whisper
 to convert speech to text and copies the result to the clipboard.
 """
 
-from .recorder import VoiceRecorder
-from .clipboard_manager import ClipboardManager
-from .device_detector import get_optimal_device, get_device_info, check_environment
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
@@ -16,4 +14,22 @@ __all__ = [
     "get_optimal_device",
     "get_device_info",
     "check_environment"
-]
\ No newline at end of file
+]
+
+# Public names are resolved on first access so that importing one submodule
+# (e.g. the clipboard or audio standalone tests) doesn't pull in torch/pynput
+_EXPORTS = {
+    "VoiceRecorder": ".recorder",
+    "ClipboardManager": ".clipboard_manager",
+    "get_optimal_device": ".device_detector",
+    "get_device_info": ".device_detector",
+    "check_environment": ".device_detector",
+}
+
+
+def __getattr__(name):
+    """Import the submodule that provides a public name on first use."""
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -6,9 +6,17 @@ Handles copying transcribed text to clipboard for easy pasting.
 import time
 import logging
 import re
+import collections
 import pyperclip
 from typing import Dict, Any
 
+# Runs of whitespace collapse to a single space
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Common Whisper transcription artifacts: a stray space before closing
+# punctuation, or after an opening bracket/quote
+_ARTIFACT_RE = re.compile(r' ([.,!?;:)\]}"\'])|([(\[{"\']) ')
+
 
 class ClipboardManager:
     """Clipboard manager for transcribed text."""
@@ -18,10 +26,14 @@ class ClipboardManager:
         self.debug_mode = debug_mode
         self.logger = logging.getLogger(__name__)
 
-        # Statistics
+        # Statistics (copy times are kept as integer nanoseconds)
         self.chars_copied = 0
         self.words_copied = 0
-        self.copy_times = []
+        self.copy_times = collections.deque(maxlen=100)
+
+        # Resolve pyperclip's backend (xclip/xsel/wl-copy/...) now rather than
+        # lazily inside the first copy, which sits on the user-visible path
+        self._copy, _ = pyperclip.determine_clipboard()
 
         if self.debug_mode:
             self.logger.info("ClipboardManager initialized")
@@ -40,31 +52,10 @@ class ClipboardManager:
             return ""
 
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-
-        # Handle common transcription artifacts
-        replacements = {
-            # Fix common Whisper transcription issues
-            ' .': '.',
-            ' ,': ',',
-            ' !': '!',
-            ' ?': '?',
-            ' ;': ';',
-            ' :': ':',
-            '( ': '(',
-            ' )': ')',
-            '[ ': '[',
-            ' ]': ']',
-            '{ ': '{',
-            ' }': '}',
-            '" ': '"',
-            ' "': '"',
-            "' ": "'",
-            " '": "'",
-        }
+        text = _WHITESPACE_RE.sub(' ', text.strip())
 
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        # Fix common Whisper transcription artifacts in a single pass
+        text = _ARTIFACT_RE.sub(r'\1\2', text)
 
         return text
 
@@ -84,7 +75,7 @@ class ClipboardManager:
             return False
 
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             # Preprocess text if requested
             if preprocess:
@@ -95,33 +86,34 @@ class ClipboardManager:
                 return False
 
             if self.debug_mode:
-                self.logger.info(f"Copying text to clipboard: '{text}' ({len(text)} chars)")
+                self.logger.info("Copying text to clipboard: '%s' (%d chars)", text, len(text))
 
             # Copy to clipboard
-            pyperclip.copy(text)
+            self._copy(text)
+
+            # Preprocessed text is stripped and single-spaced, so counting
+            # separators gives the word count without building a list
+            word_count = text.count(' ') + 1 if preprocess else len(text.split())
 
             # Update statistics
-            copy_time = time.time() - start_time
-            self.copy_times.append(copy_time)
-            if len(self.copy_times) > 100:
-                self.copy_times.pop(0)
+            copy_ns = time.perf_counter_ns() - start_ns
+            self.copy_times.append(copy_ns)
             self.chars_copied += len(text)
-            self.words_copied += len(text.split())
+            self.words_copied += word_count
 
-            word_count = len(text.split())
             preview = text[:50] + "..." if len(text) > 50 else text
 
-            # Terminal output for user feedback
-            print(f"📋 Copied to clipboard: {word_count} words")
-            print(f"   \"{preview}\"")
+            # Terminal output for user feedback (one write; the logger is
+            # silenced below ERROR outside debug mode, so it can't carry this)
+            print(f"📋 Copied to clipboard: {word_count} words\n   \"{preview}\"")
 
             if self.debug_mode:
-                self.logger.info(f"✅ Copied {len(text)} characters to clipboard in {copy_time:.2f}s")
+                self.logger.info("✅ Copied %d characters to clipboard in %.2fs", len(text), copy_ns / 1e9)
             return True
 
         except Exception as e:
             print(f"❌ Failed to copy to clipboard: {e}")
-            self.logger.error(f"❌ Failed to copy text to clipboard: {e}")
+            self.logger.error("❌ Failed to copy text to clipboard: %s", e)
             return False
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -138,14 +130,16 @@ class ClipboardManager:
                 "copies": 0
             }
 
+        # Convert to seconds only at the reporting boundary
+        total_time = sum(self.copy_times) / 1e9
         return {
             "chars_copied": self.chars_copied,
             "words_copied": self.words_copied,
             "copies": len(self.copy_times),
-            "total_time": sum(self.copy_times),
-            "avg_copy_time": sum(self.copy_times) / len(self.copy_times),
-            "min_copy_time": min(self.copy_times),
-            "max_copy_time": max(self.copy_times),
+            "total_time": total_time,
+            "avg_copy_time": total_time / len(self.copy_times),
+            "min_copy_time": min(self.copy_times) / 1e9,
+            "max_copy_time": max(self.copy_times) / 1e9,
         }
 
 
@@ -5,14 +5,18 @@ Automatically detects available compute devices (CUDA, ROCm, MPS, CPU).
 
 import torch
 import logging
+import functools
 from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_optimal_device() -> str:
     """
     Auto-detect the best available compute device.
+
+    The result is cached; the available hardware doesn't change at runtime.
     
     Returns:
         str: Device string ('cuda', 'mps', or 'cpu')
@@ -65,6 +69,24 @@ def get_device_info() -> Tuple[str, dict]:
     return device, info
 
 
+def _model_family(model_size: str) -> str:
+    """
+    Reduce a Whisper model name to its size family.
+
+    Args:
+        model_size: Model name, e.g. 'large-v3', 'small.en', 'turbo'
+
+    Returns:
+        str: Size family ('tiny', 'base', 'small', 'medium', 'large', ...)
+    """
+    name = model_size.split('.')[0]
+    if name.startswith("distil-"):
+        name = name[len("distil-"):]
+    if name == "turbo":
+        return "large"
+    return name.split('-')[0]
+
+
 def select_model_for_device(device: str, preferred_size: str = "base") -> str:
     """
     Select appropriate Whisper model based on device capabilities.
@@ -76,16 +98,18 @@ def select_model_for_device(device: str, preferred_size: str = "base") -> str:
     Returns:
         str: Recommended model size
     """
+    family = _model_family(preferred_size)
+
     if device == "cpu":
         # CPU is limited to smaller models for real-time performance
-        if preferred_size in ["large", "medium"]:
+        if family in ["large", "medium"]:
             logger.warning(f"Model '{preferred_size}' may be slow on CPU, recommending 'base'")
             return "base"
-        return preferred_size if preferred_size in ["tiny", "base", "small"] else "base"
+        return preferred_size if family in ["tiny", "base", "small"] else "base"
     
     elif device in ["cuda", "mps"]:
         # GPU can handle larger models
-        return preferred_size if preferred_size in ["tiny", "base", "small", "medium", "large"] else "base"
+        return preferred_size if family in ["tiny", "base", "small", "medium", "large"] else "base"
     
     return "base"
 
@@ -10,20 +10,31 @@ import time
 import logging
 import os
 import sys
+import struct
 import contextlib
+import weakref
 from typing import Optional, Callable, List
 
 
+def _terminate_pyaudio(pa):
+    """Release PortAudio if a recorder is collected without cleanup()."""
+    try:
+        pa.terminate()
+    except Exception:
+        pass
+
+
 class ManualAudioRecorder:
     """Manual audio recorder with start/stop control."""
     
-    def __init__(self, config: dict, debug_mode: bool = False):
+    def __init__(self, config: dict, debug_mode: bool = False, max_duration: float = 30):
         """
         Initialize ManualAudioRecorder.
 
         Args:
             config: Audio configuration dictionary
             debug_mode: Enable verbose debug logging
+            max_duration: Maximum recording length in seconds
         """
         self.config = config
         self.debug_mode = debug_mode
@@ -34,16 +45,22 @@ class ManualAudioRecorder:
         self.chunk_size = config['chunk_size']
         self.channels = config['channels']
         self.device_index = config['device_index']
+        self.max_duration = max_duration
+        # Interleaved samples, so the cap covers every channel
+        self.max_samples = int(max_duration * self.sample_rate * self.channels)
         
         # Recording state
         self.is_recording = False
-        self.audio_buffer = []
+        self.audio_buffer = np.empty(self.max_samples, dtype=np.int16)
+        self.write_index = 0
         self.recording_thread = None
         self.stop_recording_event = threading.Event()
         
         # PyAudio objects
         self.pyaudio = None
         self.stream = None
+        self._finalizer = None
+        self._devices_cache = None
         
         # Callbacks
         self.on_recording_start: Optional[Callable] = None
@@ -73,11 +90,17 @@ class ManualAudioRecorder:
             os.close(stderr_fd)
 
     def _initialize_audio(self):
-        """Initialize PyAudio and discover audio devices."""
+        """Initialize PyAudio, discover audio devices and open the input stream."""
         try:
             with self._suppress_alsa_warnings():
                 self.pyaudio = pyaudio.PyAudio()
 
+            # Safety net that holds only the PyAudio handle, never self
+            self._finalizer = weakref.finalize(self, _terminate_pyaudio, self.pyaudio)
+
+            # Decide once how raw stream bytes become int16 arrays
+            self._to_array = self._select_buffer_converter()
+
             if self.debug_mode:
                 self.logger.info("PyAudio initialized successfully")
 
@@ -88,90 +111,102 @@ class ManualAudioRecorder:
             if self.device_index is not None:
                 device_count = self.pyaudio.get_device_count()
                 if self.device_index >= device_count:
-                    self.logger.warning(f"Device index {self.device_index} out of range, using default")
+                    self.logger.warning("Device index %s out of range, using default", self.device_index)
                     self.device_index = None
+
+            # Open the stream once and keep it stopped between recordings
+            with self._suppress_alsa_warnings():
+                self.stream = self.pyaudio.open(
+                    format=pyaudio.paInt16,
+                    channels=self.channels,
+                    rate=self.sample_rate,
+                    input=True,
+                    input_device_index=self.device_index,
+                    frames_per_buffer=self.chunk_size,
+                    start=False
+                )
                     
         except Exception as e:
-            self.logger.error(f"Failed to initialize PyAudio: {e}")
+            self.logger.error("Failed to initialize PyAudio: %s", e)
             raise
     
+    def _select_buffer_converter(self) -> Callable[[bytes], np.ndarray]:
+        """
+        Probe np.frombuffer once and pick the bytes-to-array conversion.
+
+        Returns:
+            Callable[[bytes], np.ndarray]: Converter used for every stream read
+        """
+        try:
+            np.frombuffer(bytes(2 * self.chunk_size), dtype=np.int16)
+            return lambda data: np.frombuffer(data, dtype=np.int16)
+        except Exception as e:
+            self.logger.warning("Buffer conversion issue: %s, using fallback", e)
+            return lambda data: np.array(
+                struct.unpack(f'{len(data) // 2}h', data),
+                dtype=np.int16
+            )
+
     def _log_audio_devices(self):
         """Log available audio devices for debugging."""
         if not self.logger.isEnabledFor(logging.DEBUG):
             return
             
-        device_count = self.pyaudio.get_device_count()
-        self.logger.debug(f"Found {device_count} audio devices:")
+        devices = self._enumerate_devices()
+        self.logger.debug("Found %d audio input devices:", len(devices))
         
-        for i in range(device_count):
-            try:
-                device_info = self.pyaudio.get_device_info_by_index(i)
-                if device_info['maxInputChannels'] > 0:  # Input device
-                    self.logger.debug(f"  {i}: {device_info['name']} "
-                                    f"(channels: {device_info['maxInputChannels']}, "
-                                    f"rate: {device_info['defaultSampleRate']})")
-            except Exception:
-                continue
+        for device in devices:
+            self.logger.debug("  %d: %s (channels: %d, rate: %s)",
+                              device['index'], device['name'],
+                              device['channels'], device['sample_rate'])
     
     def _recording_worker(self):
         """Worker thread for recording audio data."""
         try:
-            # Open audio stream
-            with self._suppress_alsa_warnings():
-                self.stream = self.pyaudio.open(
-                    format=pyaudio.paFloat32,
-                    channels=self.channels,
-                    rate=self.sample_rate,
-                    input=True,
-                    input_device_index=self.device_index,
-                    frames_per_buffer=self.chunk_size
-                )
-            
             if self.debug_mode:
-                self.logger.info("Audio stream opened, starting recording...")
+                self.logger.info("Audio stream started, starting recording...")
             
             # Record until stop event is set
             while not self.stop_recording_event.is_set():
                 try:
-                    # Read audio data (blocking)
+                    # Read audio data (blocking); drain everything already
+                    # queued in one call, but never less than a chunk
+                    frames = max(self.chunk_size, self.stream.get_read_available())
                     audio_data = self.stream.read(
-                        self.chunk_size, 
+                        frames,
                         exception_on_overflow=False
                     )
                     
-                    # Convert to numpy array using safe method
-                    try:
-                        audio_chunk = np.frombuffer(audio_data, dtype=np.float32)
-                    except Exception as e:
-                        self.logger.warning(f"Buffer conversion issue: {e}, using fallback")
-                        # Fallback conversion
-                        import struct
-                        num_samples = len(audio_data) // 4
-                        audio_chunk = np.array(
-                            struct.unpack(f'{num_samples}f', audio_data), 
-                            dtype=np.float32
-                        )
+                    # Convert to numpy array
+                    audio_chunk = self._to_array(audio_data)
                     
-                    # Add to buffer
-                    self.audio_buffer.append(audio_chunk)
+                    # Copy into preallocated buffer
+                    n = min(len(audio_chunk), self.max_samples - self.write_index)
+                    self.audio_buffer[self.write_index:self.write_index + n] = audio_chunk[:n]
+                    self.write_index += n
+
+                    if self.write_index >= self.max_samples:
+                        print(f"⚠️  Maximum recording length ({self.max_duration:g}s) reached, "
+                              f"later audio is not recorded")
+                        self.logger.warning("Maximum recording duration reached, ignoring further audio")
+                        break
                     
                 except Exception as e:
                     if not self.stop_recording_event.is_set():
-                        self.logger.error(f"Error reading audio data: {e}")
+                        self.logger.error("Error reading audio data: %s", e)
                     break
             
         except Exception as e:
-            self.logger.error(f"Error in recording worker: {e}")
-        finally:
-            # Clean up stream
-            if self.stream:
-                try:
-                    self.stream.stop_stream()
-                    self.stream.close()
-                    self.stream = None
-                except Exception as e:
-                    self.logger.error(f"Error closing stream: {e}")
+            self.logger.error("Error in recording worker: %s", e)
     
+    def _stop_stream(self):
+        """Stop the stream after the worker exits; it stays open for the next recording."""
+        if self.stream:
+            try:
+                self.stream.stop_stream()
+            except Exception as e:
+                self.logger.error("Error stopping stream: %s", e)
+
     def start_recording(self):
         """Start recording audio."""
         if self.is_recording:
@@ -182,8 +217,15 @@ class ManualAudioRecorder:
             self.logger.info("Starting manual recording...")
 
         # Reset state
-        self.audio_buffer.clear()
+        self.write_index = 0
         self.stop_recording_event.clear()
+
+        try:
+            self.stream.start_stream()
+        except Exception as e:
+            self.logger.error("Failed to start audio stream: %s", e)
+            return False
+
         self.is_recording = True
         
         # Start recording thread
@@ -198,7 +240,7 @@ class ManualAudioRecorder:
             try:
                 self.on_recording_start()
             except Exception as e:
-                self.logger.error(f"Error in recording start callback: {e}")
+                self.logger.error("Error in recording start callback: %s", e)
         
         return True
     
@@ -217,29 +259,32 @@ class ManualAudioRecorder:
         
         if self.recording_thread:
             self.recording_thread.join(timeout=2.0)  # Wait max 2 seconds
+        self._stop_stream()
         
         # Process collected audio
-        if self.audio_buffer:
+        if self.write_index:
             try:
-                # Combine all audio chunks
-                combined_audio = np.concatenate(self.audio_buffer)
+                # Convert to float32 in [-1, 1) for Whisper; astype also copies
+                # out of the reusable buffer (processing happens asynchronously)
+                combined_audio = self.audio_buffer[:self.write_index].astype(np.float32)
+                combined_audio *= 1.0 / 32768.0
                 duration = len(combined_audio) / self.sample_rate
                 
                 if self.debug_mode:
-                    self.logger.info(f"Recording complete: {len(combined_audio)} samples "
-                                   f"({duration:.2f}s)")
+                    self.logger.info("Recording complete: %d samples (%.2fs)",
+                                     len(combined_audio), duration)
                 
                 # Trigger callback with audio data
                 if self.on_recording_stop:
                     try:
                         self.on_recording_stop(combined_audio)
                     except Exception as e:
-                        self.logger.error(f"Error in recording stop callback: {e}")
+                        self.logger.error("Error in recording stop callback: %s", e)
                 
                 return True
                 
             except Exception as e:
-                self.logger.error(f"Error processing recorded audio: {e}")
+                self.logger.error("Error processing recorded audio: %s", e)
                 return False
         else:
             self.logger.warning("No audio data recorded")
@@ -258,17 +303,21 @@ class ManualAudioRecorder:
         
         if self.recording_thread:
             self.recording_thread.join(timeout=2.0)
+        self._stop_stream()
         
-        # Clear buffer without processing
-        self.audio_buffer.clear()
+        # Discard buffered audio without processing
+        self.write_index = 0
     
-    def get_audio_devices(self) -> List[dict]:
+    def _enumerate_devices(self) -> List[dict]:
         """
-        Get list of available input audio devices.
-        
+        Query PortAudio for input devices once and cache the result.
+
         Returns:
-            List[dict]: List of device information dictionaries
+            List[dict]: Cached list of device information dictionaries
         """
+        if self._devices_cache is not None:
+            return self._devices_cache
+
         devices = []
         if not self.pyaudio:
             return devices
@@ -287,26 +336,52 @@ class ManualAudioRecorder:
             except Exception:
                 continue
         
+        self._devices_cache = devices
         return devices
+
+    def get_audio_devices(self) -> List[dict]:
+        """
+        Get list of available input audio devices.
+        
+        Returns:
+            List[dict]: List of device information dictionaries
+        """
+        return list(self._enumerate_devices())
     
     def cleanup(self):
         """Clean up resources."""
         if self.is_recording:
             self.cancel_recording()
         
+        if self.stream:
+            try:
+                self.stream.close()
+            except Exception as e:
+                self.logger.error("Error closing stream: %s", e)
+            finally:
+                self.stream = None
+
+        if self._finalizer:
+            self._finalizer.detach()
+
         if self.pyaudio:
             try:
                 self.pyaudio.terminate()
             except Exception as e:
-                self.logger.error(f"Error terminating PyAudio: {e}")
+                self.logger.error("Error terminating PyAudio: %s", e)
             finally:
                 self.pyaudio = None
+                self._devices_cache = None
         
         if self.debug_mode:
             self.logger.info("ManualAudioRecorder cleaned up")
     
-    def __del__(self):
-        """Destructor to ensure cleanup."""
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit, releases audio resources."""
         self.cleanup()
 
 
@@ -325,8 +400,6 @@ if __name__ == "__main__":
         'device_index': 0  # Default audio device
     }
     
-    recorder = ManualAudioRecorder(config)
-    
     # Set up callbacks
     def on_start():
         print("🎤 Recording started!")
@@ -335,43 +408,41 @@ if __name__ == "__main__":
         print(f"🛑 Recording stopped! Captured {len(audio_data)} samples "
               f"({len(audio_data) / config['sample_rate']:.2f}s)")
     
-    recorder.on_recording_start = on_start
-    recorder.on_recording_stop = on_stop
-    
-    # Handle Ctrl+C
+    # Handle Ctrl+C (SystemExit unwinds the with block, which cleans up)
     def signal_handler(sig, frame):
         print("\nStopping...")
-        recorder.cleanup()
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
     
-    print("=== Manual Audio Recorder Test ===")
-    print("Available devices:")
-    for device in recorder.get_audio_devices():
-        print(f"  {device['index']}: {device['name']}")
-    
-    print("\nPress 's' to START recording, 'q' to STOP and quit, 'c' to CANCEL")
-    
-    try:
-        while True:
-            command = input("> ").lower().strip()
-            
-            if command == 's':
-                recorder.start_recording()
-            elif command == 'q':
-                if recorder.is_recording:
-                    recorder.stop_recording()
-                break
-            elif command == 'c':
-                recorder.cancel_recording()
-            elif command == 'stop':
-                if recorder.is_recording:
-                    recorder.stop_recording()
-            else:
-                print("Commands: 's' = start, 'stop' = stop recording, 'c' = cancel, 'q' = quit")
+    with ManualAudioRecorder(config) as recorder:
+        recorder.on_recording_start = on_start
+        recorder.on_recording_stop = on_stop
+        
+        print("=== Manual Audio Recorder Test ===")
+        print("Available devices:")
+        for device in recorder.get_audio_devices():
+            print(f"  {device['index']}: {device['name']}")
+        
+        print("\nPress 's' to START recording, 'q' to STOP and quit, 'c' to CANCEL")
+        
+        try:
+            while True:
+                command = input("> ").lower().strip()
                 
-    except KeyboardInterrupt:
-        pass
-    finally:
-        recorder.cleanup()
\ No newline at end of file
+                if command == 's':
+                    recorder.start_recording()
+                elif command == 'q':
+                    if recorder.is_recording:
+                        recorder.stop_recording()
+                    break
+                elif command == 'c':
+                    recorder.cancel_recording()
+                elif command == 'stop':
+                    if recorder.is_recording:
+                        recorder.stop_recording()
+                else:
+                    print("Commands: 's' = start, 'stop' = stop recording, 'c' = cancel, 'q' = quit")
+                    
+        except KeyboardInterrupt:
+            pass
\ No newline at end of file
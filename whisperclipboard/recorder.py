@@ -12,12 +12,33 @@ import yaml
 import logging
 import argparse
 import threading
-import time
+import queue
 from pathlib import Path
 from pynput import keyboard
 
 from .device_detector import get_optimal_device, get_device_info, check_environment
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Map common key names to pynput format
+_KEY_MAPPING = {
+    'ctrl_r': keyboard.Key.ctrl_r,
+    'ctrl_l': keyboard.Key.ctrl_l,
+    'right_ctrl': keyboard.Key.ctrl_r,
+    'left_ctrl': keyboard.Key.ctrl_l,
+    'alt_r': keyboard.Key.alt_r,
+    'alt_l': keyboard.Key.alt_l,
+    'right_alt': keyboard.Key.alt_r,
+    'left_alt': keyboard.Key.alt_l,
+    'f12': keyboard.Key.f12,
+    'f11': keyboard.Key.f11,
+    'f10': keyboard.Key.f10,
+}
+
 
 class VoiceRecorder:
     """Voice recording and transcription with clipboard integration."""
@@ -42,30 +63,35 @@ class VoiceRecorder:
         self.clipboard_manager = None
         self.keyboard_listener = None
         self.hotkey_pressed = False
+        self.audio_queue = None
+        self.transcription_thread = None
+        self.hotkey_queue = None
+        self.hotkey_thread = None
+        self.shutdown_event = threading.Event()
 
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file."""
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            with open(config_path, 'rb') as f:
+                return yaml.load(f.read(), Loader=SafeLoader)
         except FileNotFoundError:
-            logging.error(f"Configuration file {config_path} not found")
+            logging.error("Configuration file %s not found", config_path)
             sys.exit(1)
         except yaml.YAMLError as e:
-            logging.error(f"Error parsing configuration file: {e}")
+            logging.error("Error parsing configuration file: %s", e)
             sys.exit(1)
 
     def _setup_logging(self):
         """Setup logging based on configuration."""
         if self.debug_mode:
             level = getattr(logging, self.config['system']['log_level'], logging.INFO)
+            handlers = [logging.StreamHandler(sys.stdout)]
+            if self.config['system']['debug_mode']:
+                handlers.append(logging.FileHandler('whisper_clipboard.log'))
             logging.basicConfig(
                 level=level,
                 format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.StreamHandler(sys.stdout),
-                    logging.FileHandler('whisper_clipboard.log') if self.config['system']['debug_mode'] else logging.NullHandler()
-                ]
+                handlers=handlers
             )
         else:
             # Minimal logging for normal use - only errors
@@ -86,7 +112,7 @@ class VoiceRecorder:
             device = config_device
 
         if self.debug_mode:
-            self.logger.info(f"Using device: {device}")
+            self.logger.info("Using device: %s", device)
             if self.config['system']['debug_mode']:
                 check_environment()
 
@@ -103,13 +129,21 @@ class VoiceRecorder:
         from .clipboard_manager import ClipboardManager
 
         # Initialize components
-        self.audio_recorder = ManualAudioRecorder(self.config['audio'], debug_mode=self.debug_mode)
+        self.audio_recorder = ManualAudioRecorder(
+            self.config['audio'],
+            debug_mode=self.debug_mode,
+            max_duration=self.config['recording'].get('max_duration', 30)
+        )
         self.transcriber = WhisperTranscriber(
             model_size=self.config['whisper']['model_size'],
             device=self.device,
             language=self.config['whisper']['language'],
             debug_mode=self.debug_mode,
-            load_model=True  # Load model immediately on startup
+            load_model=True,  # Load model immediately on startup
+            backend=self.config['whisper'].get('backend', 'openai-whisper'),
+            compute_type=self.config['whisper'].get('compute_type', 'auto'),
+            compile_model=self.config['whisper'].get('compile', False),
+            silence_threshold=self.config['recording'].get('silence_threshold', 0.001)
         )
         self.clipboard_manager = ClipboardManager(debug_mode=self.debug_mode)
 
@@ -117,6 +151,14 @@ class VoiceRecorder:
         self.audio_recorder.on_recording_start = self._on_recording_start
         self.audio_recorder.on_recording_stop = self._on_recording_stop
 
+        # Single long-lived worker processes recordings in order
+        self.audio_queue = queue.SimpleQueue()
+        self.transcription_thread = threading.Thread(
+            target=self._transcription_worker,
+            daemon=True
+        )
+        self.transcription_thread.start()
+
         if self.debug_mode:
             self.logger.info("All components initialized successfully")
 
@@ -124,32 +166,26 @@ class VoiceRecorder:
         """Set up keyboard listener for hotkey detection."""
         record_key = self.config['hotkeys']['record_key']
 
-        # Map common key names to pynput format
-        key_mapping = {
-            'ctrl_r': keyboard.Key.ctrl_r,
-            'ctrl_l': keyboard.Key.ctrl_l,
-            'right_ctrl': keyboard.Key.ctrl_r,
-            'left_ctrl': keyboard.Key.ctrl_l,
-            'alt_r': keyboard.Key.alt_r,
-            'alt_l': keyboard.Key.alt_l,
-            'right_alt': keyboard.Key.alt_r,
-            'left_alt': keyboard.Key.alt_l,
-            'f12': keyboard.Key.f12,
-            'f11': keyboard.Key.f11,
-            'f10': keyboard.Key.f10,
-        }
-
-        self.target_key = key_mapping.get(record_key, record_key)
+        self.target_key = _KEY_MAPPING.get(record_key, record_key)
+
+        # Listener callbacks only enqueue; stream start/stop runs on a
+        # separate thread so input handling is never blocked by audio I/O
+        self.hotkey_queue = queue.SimpleQueue()
+        self.hotkey_thread = threading.Thread(
+            target=self._hotkey_worker,
+            daemon=True
+        )
+        self.hotkey_thread.start()
 
         def on_press(key):
             if key == self.target_key and not self.hotkey_pressed:
                 self.hotkey_pressed = True
-                self._start_recording()
+                self.hotkey_queue.put(self._start_recording)
 
         def on_release(key):
             if key == self.target_key and self.hotkey_pressed:
                 self.hotkey_pressed = False
-                self._stop_recording()
+                self.hotkey_queue.put(self._stop_recording)
 
         self.keyboard_listener = keyboard.Listener(
             on_press=on_press,
@@ -157,7 +193,7 @@ class VoiceRecorder:
         )
         self.keyboard_listener.start()
         if self.debug_mode:
-            self.logger.info(f"Hotkey listener started for key: {record_key}")
+            self.logger.info("Hotkey listener started for key: %s", record_key)
 
     def start_hotkey_mode(self):
         """Start the hotkey-based recording mode."""
@@ -171,9 +207,8 @@ class VoiceRecorder:
             print(f"🛑 Press Ctrl+C to quit")
             print()
 
-            # Keep running until interrupted
-            while True:
-                time.sleep(0.1)
+            # Block until interrupted or cleaned up elsewhere
+            self.shutdown_event.wait()
 
         except KeyboardInterrupt:
             print("\nShutting down...")
@@ -201,8 +236,30 @@ class VoiceRecorder:
             print("🎯 Transcribing...")
         self.is_recording = False
 
-        # Transcribe audio in background thread to avoid blocking
-        threading.Thread(target=self._process_audio, args=(audio_data,), daemon=True).start()
+        # Hand off to the transcription worker to avoid blocking
+        self.audio_queue.put(audio_data)
+
+    def _hotkey_worker(self):
+        """Worker thread that runs queued hotkey actions in press/release order."""
+        while True:
+            action = self.hotkey_queue.get()
+            if action is None:
+                break
+            try:
+                action()
+            except Exception as e:
+                self.logger.error("❌ Error handling hotkey: %s", e)
+
+    def _transcription_worker(self):
+        """Worker thread that transcribes queued recordings until stopped."""
+        # Absorb first-call kernel setup before the user's first recording
+        self.transcriber.warmup()
+
+        while True:
+            audio_data = self.audio_queue.get()
+            if audio_data is None:
+                break
+            self._process_audio(audio_data)
 
     def _process_audio(self, audio_data):
         """
@@ -220,7 +277,7 @@ class VoiceRecorder:
 
             if text and text.strip():
                 if self.debug_mode:
-                    self.logger.info(f"💬 Transcribed: '{text}'")
+                    self.logger.info("💬 Transcribed: '%s'", text)
 
                 # Copy text to clipboard
                 success = self.clipboard_manager.copy_to_clipboard(text)
@@ -237,7 +294,7 @@ class VoiceRecorder:
                     print("⚠️  No speech detected")
 
         except Exception as e:
-            self.logger.error(f"❌ Error processing audio: {e}")
+            self.logger.error("❌ Error processing audio: %s", e)
 
     def _start_recording(self):
         """Start audio recording (called by hotkey handler)."""
@@ -331,13 +388,35 @@ class VoiceRecorder:
         finally:
             self.cleanup()
 
+    def wait_for_transcriptions(self):
+        """Block until every queued recording is transcribed, then stop the worker."""
+        if self.transcription_thread:
+            self.audio_queue.put(None)
+            self.transcription_thread.join()
+
     def cleanup(self):
         """Clean up resources."""
+        self.shutdown_event.set()
         if self.keyboard_listener:
             self.keyboard_listener.stop()
+        if self.hotkey_thread:
+            self.hotkey_queue.put(None)
+            self.hotkey_thread.join()
         if self.audio_recorder:
             self.audio_recorder.cleanup()
-        if self.transcriber:
+        if self.transcription_thread:
+            # Drop recordings that haven't started so shutdown doesn't wait on them
+            try:
+                while True:
+                    self.audio_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.audio_queue.put(None)
+            self.transcription_thread.join(timeout=2.0)
+        # Leave the model to a worker still mid-transcription; it is a daemon
+        # thread, so process exit frees both
+        worker_busy = self.transcription_thread is not None and self.transcription_thread.is_alive()
+        if self.transcriber and not worker_busy:
             self.transcriber.cleanup()
 
         if self.debug_mode:
@@ -3,16 +3,33 @@ Whisper transcription module for Whisper Clipboard.
 Handles GPU-accelerated speech-to-text transcription with device fallback.
 """
 
-import whisper
+import os
 import torch
 import numpy as np
 import logging
 import threading
 import time
 import re
-from typing import Optional, Dict, Any
+import collections
+from typing import Optional, Dict, Any, Tuple
 from .device_detector import get_optimal_device, select_model_for_device
 
+# whisper is imported where first needed: its import takes seconds, and the
+# faster-whisper backend never needs it
+
+# Text post-processing patterns, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_FILLER_RE = re.compile(r'\b(?:um|uh|er|ah|like|you know)\b', re.IGNORECASE)
+# First character, or a lowercase letter starting a new sentence
+_SENTENCE_START_RE = re.compile(r'^.|(?<=[.!?])\s+[a-z]', re.DOTALL)
+
+# Text processing defaults used when no config is passed
+_DEFAULT_TEXT_CONFIG = {
+    'auto_capitalize': True,
+    'auto_punctuate': True,
+    'remove_filler_words': False
+}
+
 
 class WhisperTranscriber:
     """GPU-accelerated Whisper transcription with fallback support."""
@@ -22,7 +39,11 @@ class WhisperTranscriber:
                  device: str = "auto",
                  language: Optional[str] = "en",
                  debug_mode: bool = False,
-                 load_model: bool = True):
+                 load_model: bool = True,
+                 backend: str = "openai-whisper",
+                 compute_type: str = "auto",
+                 compile_model: bool = False,
+                 silence_threshold: float = 0.0):
         """
         Initialize WhisperTranscriber.
 
@@ -32,6 +53,12 @@ class WhisperTranscriber:
             language: Target language (None for auto-detect)
             debug_mode: Enable verbose debug logging
             load_model: Load model immediately during initialization
+            backend: Inference backend (openai-whisper, faster-whisper)
+            compute_type: Weight precision for faster-whisper
+                (auto, int8, int8_float16, float16, float32)
+            compile_model: torch.compile the encoder (openai-whisper on CUDA)
+            silence_threshold: RMS below which audio is skipped as digital
+                silence, e.g. a muted mic (0 disables)
         """
         self.debug_mode = debug_mode
         self.logger = logging.getLogger(__name__)
@@ -39,6 +66,10 @@ class WhisperTranscriber:
         # Configuration
         self.model_size = model_size
         self.language = language
+        self.backend = backend
+        self.compute_type = compute_type
+        self.compile_model = compile_model
+        self.silence_threshold = silence_threshold
         self.device = device if device != "auto" else get_optimal_device()
 
         # Optimize model size for device
@@ -48,19 +79,82 @@ class WhisperTranscriber:
         self.model = None
         self.model_load_lock = threading.Lock()
         self.is_loading = False
+        self._pinned_audio = None
 
         # Performance tracking
-        self.transcription_times = []
+        self.transcription_times = collections.deque(maxlen=100)
+        self._transcription_time_sum = 0.0
         self.last_transcription_time = 0.0
 
         if self.debug_mode:
             self.logger.info(f"WhisperTranscriber initialized: model={self.model_size}, "
-                            f"device={self.device}, language={self.language}")
+                            f"device={self.device}, language={self.language}, "
+                            f"backend={self.backend}")
 
         # Load model immediately if requested
         if load_model:
             self._load_model()
     
+    def _resolve_compute_type(self, device: str) -> str:
+        """
+        Pick the faster-whisper compute type for a device.
+
+        Args:
+            device: Target device
+
+        Returns:
+            str: CTranslate2 compute type
+        """
+        if self.compute_type != "auto":
+            return self.compute_type
+
+        import ctranslate2
+
+        # Lowest-precision type the hardware runs natively: int8 weights with
+        # float16 activations on tensor-core GPUs, int8 on CPU
+        if device == "cpu":
+            ct2_device, preferred = "cpu", ("int8",)
+        else:
+            ct2_device, preferred = "cuda", ("int8_float16", "int8", "float16")
+
+        supported = ctranslate2.get_supported_compute_types(ct2_device)
+        for compute_type in preferred:
+            if compute_type in supported:
+                return compute_type
+        return "float32"
+
+    def _create_model(self, model_size: str, device: str):
+        """
+        Instantiate the configured backend.
+
+        Args:
+            model_size: Whisper model size
+            device: Target device
+
+        Returns:
+            Loaded model object
+        """
+        if self.backend == "faster-whisper":
+            from faster_whisper import WhisperModel
+            return WhisperModel(model_size, device=device,
+                                compute_type=self._resolve_compute_type(device))
+
+        import whisper
+
+        model = whisper.load_model(model_size, device=device)
+        if self.compile_model and device.startswith("cuda"):
+            # Only the encoder has a fixed input shape (one 30s mel window);
+            # the decoder's growing kv-cache would recompile every step.
+            # Keep compiled kernels out of /tmp so they survive reboots
+            # (an explicit TORCHINDUCTOR_CACHE_DIR still wins)
+            os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", os.path.join(
+                os.path.expanduser("~"), ".cache", "whisper-clipboard", "inductor"))
+            import torch._inductor.config as inductor_config
+            if hasattr(inductor_config, "fx_graph_cache"):  # Not in older torch 2.x
+                inductor_config.fx_graph_cache = True
+            model.encoder = torch.compile(model.encoder)
+        return model
+
     def _load_model(self) -> bool:
         """
         Load Whisper model.
@@ -86,16 +180,16 @@ class WhisperTranscriber:
                 if self.debug_mode:
                     self.logger.info(f"Loading Whisper model '{self.model_size}' on {self.device}...")
 
-                start_time = time.time()
-                self.model = whisper.load_model(self.model_size, device=self.device)
-                load_time = time.time() - start_time
+                start_time = time.perf_counter()
+                self.model = self._create_model(self.model_size, self.device)
+                load_time = time.perf_counter() - start_time
 
                 print(f"✅ Model loaded in {load_time:.1f}s")
                 if self.debug_mode:
                     self.logger.info(f"Model loaded successfully in {load_time:.2f}s")
 
                     # Log model info
-                    if hasattr(self.model, 'device'):
+                    if self.backend == "openai-whisper":
                         actual_device = next(self.model.parameters()).device
                         self.logger.info(f"Model loaded on device: {actual_device}")
                 
@@ -110,7 +204,7 @@ class WhisperTranscriber:
                     try:
                         self.device = "cpu"
                         self.model_size = select_model_for_device("cpu", self.model_size)
-                        self.model = whisper.load_model(self.model_size, device="cpu")
+                        self.model = self._create_model(self.model_size, "cpu")
                         self.logger.info(f"Fallback successful: model={self.model_size}, device=cpu")
                         return True
                     except Exception as fallback_error:
@@ -121,7 +215,7 @@ class WhisperTranscriber:
             finally:
                 self.is_loading = False
     
-    def _preprocess_audio(self, audio_data: np.ndarray) -> np.ndarray:
+    def _preprocess_audio(self, audio_data: np.ndarray) -> Tuple[np.ndarray, float]:
         """
         Preprocess audio data for Whisper.
         
@@ -129,24 +223,27 @@ class WhisperTranscriber:
             audio_data: Raw audio data from recorder
             
         Returns:
-            np.ndarray: Preprocessed audio data
+            Tuple[np.ndarray, float]: Preprocessed audio data and its RMS level
         """
-        # Ensure audio is float32
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
+        # Work on a single float32 copy and modify it in place from here on
+        audio = np.array(audio_data, dtype=np.float32)
         
         # Whisper expects audio in [-1, 1] range
-        if np.abs(audio_data).max() > 1.0:
-            audio_data = audio_data / np.abs(audio_data).max()
+        # Two reductions over the buffer instead of materializing np.abs()
+        peak = max(-audio.min(), audio.max())
+        if peak > 1.0:
+            audio /= peak
         
         # Remove DC bias
-        audio_data = audio_data - np.mean(audio_data)
+        audio -= audio.mean()
         
         # Basic noise gate (remove very quiet sections)
-        threshold = np.std(audio_data) * 0.1
-        audio_data = np.where(np.abs(audio_data) < threshold, 0, audio_data)
+        # Audio is zero-mean here, so RMS equals the standard deviation
+        rms = np.sqrt(np.dot(audio, audio) / len(audio))
+        threshold = rms * 0.1
+        audio[np.abs(audio) < threshold] = 0
         
-        return audio_data
+        return audio, rms
     
     def _postprocess_text(self, text: str, config: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -164,31 +261,22 @@ class WhisperTranscriber:
         
         # Default config if not provided
         if config is None:
-            config = {
-                'auto_capitalize': True,
-                'auto_punctuate': True,
-                'remove_filler_words': False
-            }
+            config = _DEFAULT_TEXT_CONFIG
         
         # Clean up whitespace
         text = text.strip()
-        text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single space
+        text = _WHITESPACE_RE.sub(' ', text)  # Multiple spaces to single space
         
         # Remove filler words if enabled
         if config.get('remove_filler_words', False):
-            filler_words = ['um', 'uh', 'er', 'ah', 'like', 'you know']
-            pattern = r'\b(?:' + '|'.join(filler_words) + r')\b'
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-            text = re.sub(r'\s+', ' ', text).strip()  # Clean up spaces again
+            text = _FILLER_RE.sub('', text)
+            text = _WHITESPACE_RE.sub(' ', text).strip()  # Clean up spaces again
         
         # Auto-capitalize if enabled
         if config.get('auto_capitalize', True):
-            # Capitalize first letter
-            if text:
-                text = text[0].upper() + text[1:]
-            
-            # Capitalize after sentence endings
-            text = re.sub(r'([.!?]\s+)([a-z])', lambda m: m.group(1) + m.group(2).upper(), text)
+            # Capitalize the first letter and after sentence endings in one
+            # pass (upper() leaves the matched whitespace unchanged)
+            text = _SENTENCE_START_RE.sub(lambda m: m.group().upper(), text)
         
         # Auto-punctuate if enabled (basic heuristics)
         if config.get('auto_punctuate', True):
@@ -220,43 +308,42 @@ class WhisperTranscriber:
             return None
         
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Preprocess audio
-            processed_audio = self._preprocess_audio(audio_data)
+            processed_audio, rms = self._preprocess_audio(audio_data)
+            
+            # Skip the model for digital silence (muted or dead input); quiet
+            # room noise is left to Whisper's own no-speech detection
+            if rms < self.silence_threshold:
+                if self.debug_mode:
+                    self.logger.info("Audio below silence threshold, skipping transcription")
+                return None
             
             # Log audio info
             duration = len(processed_audio) / 16000  # Assuming 16kHz
             self.logger.debug(f"Transcribing {duration:.2f}s of audio...")
             
             # Transcribe
-            transcribe_options = {
-                "language": self.language,
-                "task": "transcribe",
-                "fp16": self.device != "cpu",  # Use fp16 on GPU for speed
-            }
-            
-            result = self.model.transcribe(processed_audio, **transcribe_options)
-            
-            # Extract text
-            raw_text = result.get("text", "").strip()
+            raw_text = self._run_model(processed_audio)
             
             # Post-process text
             final_text = self._postprocess_text(raw_text, text_config)
             
             # Performance tracking
-            transcription_time = time.time() - start_time
+            transcription_time = time.perf_counter() - start_time
             self.last_transcription_time = transcription_time
-            self.transcription_times.append(transcription_time)
             
-            # Keep only last 100 times for average calculation
-            if len(self.transcription_times) > 100:
-                self.transcription_times.pop(0)
+            # Keep only last 100 times, with a running sum for the average
+            if len(self.transcription_times) == self.transcription_times.maxlen:
+                self._transcription_time_sum -= self.transcription_times[0]
+            self.transcription_times.append(transcription_time)
+            self._transcription_time_sum += transcription_time
             
             # Log results
             if final_text:
                 if self.debug_mode:
-                    avg_time = np.mean(self.transcription_times)
+                    avg_time = self._transcription_time_sum / len(self.transcription_times)
                     real_time_factor = transcription_time / duration if duration > 0 else 0
 
                     self.logger.info(f"Transcribed in {transcription_time:.2f}s "
@@ -272,6 +359,74 @@ class WhisperTranscriber:
             self.logger.error(f"Transcription failed: {e}")
             return None
     
+    def _run_model(self, audio: np.ndarray) -> str:
+        """
+        Run the loaded backend on preprocessed audio.
+
+        Args:
+            audio: Preprocessed 16kHz float32 audio
+
+        Returns:
+            str: Raw transcribed text
+        """
+        if self.backend == "faster-whisper":
+            # Greedy decoding, matching openai-whisper's transcribe() default
+            segments, _ = self.model.transcribe(audio, language=self.language,
+                                                task="transcribe", beam_size=1,
+                                                without_timestamps=True)
+            return "".join(segment.text for segment in segments).strip()
+
+        transcribe_options = {
+            "language": self.language,
+            "task": "transcribe",
+            "fp16": self.device != "cpu",  # Use fp16 on GPU for speed
+            "without_timestamps": True,  # Only the text goes to the clipboard
+        }
+
+        # On CUDA, upload the waveform first so Whisper computes the
+        # log-Mel spectrogram (STFT + mel filterbank) on the GPU too
+        audio_input = audio
+        if self.device.startswith("cuda"):
+            audio_input = self._upload_audio(audio)
+
+        result = self.model.transcribe(audio_input, **transcribe_options)
+        return result.get("text", "").strip()
+
+    def _upload_audio(self, audio: np.ndarray) -> torch.Tensor:
+        """
+        Copy audio to the GPU through a reused page-locked staging buffer.
+
+        Args:
+            audio: Preprocessed 16kHz float32 audio
+
+        Returns:
+            torch.Tensor: Audio tensor on the model's device
+        """
+        import whisper
+
+        n = len(audio)
+        if self._pinned_audio is None or self._pinned_audio.numel() < n:
+            # Sized for at least one 30s Whisper window, grown if needed
+            size = max(n, whisper.audio.N_SAMPLES)
+            self._pinned_audio = torch.empty(size, dtype=torch.float32).pin_memory()
+
+        staging = self._pinned_audio[:n]
+        staging.copy_(torch.from_numpy(audio))
+        return staging.to(self.device, non_blocking=True)
+
+    def warmup(self):
+        """Run the model once on silence to absorb first-call initialization."""
+        if self.model is None:
+            return
+
+        try:
+            start_time = time.perf_counter()
+            self._run_model(np.zeros(16000, dtype=np.float32))
+            if self.debug_mode:
+                self.logger.info(f"Model warmed up in {time.perf_counter() - start_time:.2f}s")
+        except Exception as e:
+            self.logger.warning(f"Model warmup failed: {e}")
+
     def get_performance_stats(self) -> Dict[str, Any]:
         """
         Get transcription performance statistics.
@@ -286,9 +441,9 @@ class WhisperTranscriber:
         return {
             "transcriptions": len(times),
             "last_time": self.last_transcription_time,
-            "avg_time": np.mean(times),
-            "min_time": np.min(times),
-            "max_time": np.max(times),
+            "avg_time": self._transcription_time_sum / len(times),
+            "min_time": min(times),
+            "max_time": max(times),
             "model_size": self.model_size,
             "device": self.device,
             "model_loaded": self.model is not None
@@ -305,17 +460,26 @@ class WhisperTranscriber:
             "model_size": self.model_size,
             "device": self.device,
             "language": self.language,
+            "backend": self.backend,
             "loaded": self.model is not None,
+            "compute_type": self.compute_type,
         }
         
         if self.model is not None:
             try:
-                actual_device = next(self.model.parameters()).device
-                info["actual_device"] = str(actual_device)
-                
-                # Count parameters (approximate)
-                total_params = sum(p.numel() for p in self.model.parameters())
-                info["parameters"] = total_params
+                if self.backend == "faster-whisper":
+                    # CTranslate2 may have converted the requested type (e.g.
+                    # after a CPU fallback), so ask the loaded model
+                    info["compute_type"] = self.model.model.compute_type
+                else:
+                    info["compute_type"] = "float16" if self.device != "cpu" else "float32"
+
+                    actual_device = next(self.model.parameters()).device
+                    info["actual_device"] = str(actual_device)
+                    
+                    # Count parameters (approximate)
+                    total_params = sum(p.numel() for p in self.model.parameters())
+                    info["parameters"] = total_params
                 
             except Exception as e:
                 self.logger.debug(f"Could not get detailed model info: {e}")
@@ -330,6 +494,7 @@ class WhisperTranscriber:
                     self.logger.info("Unloading Whisper model...")
                 del self.model
                 self.model = None
+                self._pinned_audio = None
                 
                 # Clear GPU cache if using CUDA
                 if torch.cuda.is_available():
@@ -364,8 +529,11 @@ if __name__ == "__main__":
     # Generate test audio (1 second of sine wave at 440Hz)
     sample_rate = 16000
     duration = 1.0
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    test_audio = np.sin(440 * 2 * np.pi * t).astype(np.float32) * 0.1
+    # Build the tone in place in a single float32 buffer
+    test_audio = np.linspace(0, duration, int(sample_rate * duration), False, dtype=np.float32)
+    test_audio *= 440 * 2 * np.pi
+    np.sin(test_audio, out=test_audio)
+    test_audio *= 0.1
     
     print(f"Testing with {len(test_audio)} samples ({duration}s)...")
     